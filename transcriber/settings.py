@@ -60,6 +60,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Wait for a busy writer instead of failing with "database is locked"
+            'timeout': 20,
+        },
     }
 }
 
@@ -90,4 +94,10 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Transcript storage compression: 'none', 'zlib' or 'zstd' (requires zstandard).
+# TRANSCRIPT_COMPRESSION_DICT optionally points at a shared dictionary trained
+# with `manage.py train_transcript_dictionary`.
+TRANSCRIPT_COMPRESSION = os.getenv('TRANSCRIPT_COMPRESSION', 'none')
+TRANSCRIPT_COMPRESSION_DICT = os.getenv('TRANSCRIPT_COMPRESSION_DICT', '')
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
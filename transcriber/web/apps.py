@@ -0,0 +1,27 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+from .compression import check_configuration
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Let pollers and listings read while transcription workers write.
+
+    WAL journaling allows concurrent readers alongside a single writer, and
+    synchronous=NORMAL is durable enough in WAL mode while avoiding an fsync on
+    every commit.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+
+
+class WebConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'transcriber.web'
+
+    def ready(self):
+        check_configuration()
+        connection_created.connect(configure_sqlite)
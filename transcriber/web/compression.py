@@ -0,0 +1,205 @@
+"""Transcript compression.
+
+Transcripts are stored compressed when ``TRANSCRIPT_COMPRESSION`` is set to
+``zstd`` or ``zlib``. Both codecs can use a shared dictionary trained on
+existing transcripts (see the ``train_transcript_dictionary`` command), which
+pays off for short, repetitive "Speaker N: ..." text.
+
+The codec is detected from each payload (zstd and zlib have distinct magic
+bytes), so rows stay readable when ``TRANSCRIPT_COMPRESSION`` changes. The
+dictionary is not stored with the row, only its id (zlib's FDICT checksum, the
+zstd frame's dict id) plus, for zstd, a content checksum that also catches
+raw-content dictionaries, which have no id. After the dictionary is changed or
+unset, old rows raise TranscriptDecompressionError until they are rewritten. Run
+``compress_transcripts --decompress`` before switching dictionaries.
+"""
+import gzip
+import os
+import zlib
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, only needed for the zstd codec
+    zstandard = None
+
+CODECS = ('none', 'zlib', 'zstd')
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# FLG bit in the zlib header saying a 4-byte adler32 of the dictionary follows
+ZLIB_FDICT = 0x20
+# zlib only keeps a 32 KiB window, so only the tail of a larger dictionary is used
+ZLIB_MAX_DICT_SIZE = 32 * 1024
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 19
+
+
+class TranscriptDecompressionError(ValueError):
+    """A stored transcript could not be decompressed"""
+
+
+def get_codec() -> str:
+    """Return the configured codec name"""
+    codec = (settings.TRANSCRIPT_COMPRESSION or 'none').lower()
+    if codec not in CODECS:
+        raise ImproperlyConfigured(
+            f"TRANSCRIPT_COMPRESSION must be one of {', '.join(CODECS)}, got {codec!r}"
+        )
+    if codec == 'zstd' and zstandard is None:
+        raise ImproperlyConfigured("TRANSCRIPT_COMPRESSION=zstd requires the zstandard package")
+    return codec
+
+
+def compression_enabled() -> bool:
+    return get_codec() != 'none'
+
+
+def check_configuration() -> None:
+    """Validate the compression settings; called once when the app loads.
+
+    Raises:
+        ImproperlyConfigured: If the codec is unknown or unavailable, or the
+            dictionary file cannot be read
+    """
+    get_codec()
+    path = settings.TRANSCRIPT_COMPRESSION_DICT
+    if path and not os.access(path, os.R_OK):
+        raise ImproperlyConfigured(
+            f"TRANSCRIPT_COMPRESSION_DICT points to {path!r}, which is missing or unreadable"
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_dictionary(path: str) -> Optional[bytes]:
+    if not path:
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def get_dictionary() -> Optional[bytes]:
+    """Return the raw bytes of the shared dictionary, if one is configured"""
+    return _load_dictionary(settings.TRANSCRIPT_COMPRESSION_DICT)
+
+
+@lru_cache(maxsize=8)
+def _zstd_dict(data: Optional[bytes]):
+    # Loading (and precomputing) a dictionary costs far more than compressing
+    # one transcript, so reuse it; dictionary objects are safe to share.
+    if not data:
+        return None
+    dict_data = zstandard.ZstdCompressionDict(data)
+    dict_data.precompute_compress(level=ZSTD_LEVEL)
+    return dict_data
+
+
+def compress_transcript(text: str, codec: Optional[str] = None,
+                        dictionary: Optional[bytes] = None) -> bytes:
+    """Compress a transcript.
+
+    Args:
+        text (str): The transcript text
+        codec (str): 'zlib' or 'zstd'; defaults to the configured codec
+        dictionary (bytes): Shared dictionary; defaults to the configured one
+
+    Returns:
+        bytes: The compressed payload
+    """
+    codec = codec or get_codec()
+    if dictionary is None:
+        dictionary = get_dictionary()
+    data = text.encode('utf-8')
+
+    if codec == 'zstd':
+        # Compressors are not thread-safe, so build one per call. Raw-content
+        # dictionaries have no id in the frame, so the checksum is what exposes
+        # decompression with the wrong dictionary.
+        compressor = zstandard.ZstdCompressor(
+            level=ZSTD_LEVEL, dict_data=_zstd_dict(dictionary), write_checksum=True,
+        )
+        return compressor.compress(data)
+    if codec == 'zlib':
+        if dictionary:
+            compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary[-ZLIB_MAX_DICT_SIZE:])
+        else:
+            compressor = zlib.compressobj(ZLIB_LEVEL)
+        return compressor.compress(data) + compressor.flush()
+    raise ValueError(f"Cannot compress with codec {codec!r}")
+
+
+def decompress_transcript(payload, dictionary: Optional[bytes] = None) -> str:
+    """Decompress a payload produced by compress_transcript.
+
+    The codec is detected from the payload itself, and the dictionary id the
+    payload was written with is checked against the given one.
+
+    Args:
+        payload (bytes | memoryview): The compressed payload
+        dictionary (bytes): Shared dictionary; defaults to the configured one
+
+    Returns:
+        str: The transcript text
+
+    Raises:
+        TranscriptDecompressionError: If the payload needs a different
+            dictionary than the one given, or is corrupt
+    """
+    payload = bytes(payload)
+    if dictionary is None:
+        try:
+            dictionary = get_dictionary()
+        except OSError as e:
+            raise TranscriptDecompressionError(f"Could not load the transcript dictionary: {e}")
+
+    if payload.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ImproperlyConfigured("Reading zstd transcripts requires the zstandard package")
+        try:
+            needed = zstandard.get_frame_parameters(payload).dict_id
+            dict_data = _zstd_dict(dictionary)
+            if needed:
+                _check_dictionary('zstd', needed, dict_data.dict_id() if dict_data else None)
+            data = zstandard.ZstdDecompressor(dict_data=dict_data).decompress(payload)
+        except zstandard.ZstdError as e:
+            raise TranscriptDecompressionError(
+                f"Corrupt zstd transcript, or written with a different dictionary: {e}"
+            )
+    else:
+        zdict = dictionary[-ZLIB_MAX_DICT_SIZE:] if dictionary else None
+        if len(payload) >= 6 and payload[1] & ZLIB_FDICT:
+            _check_dictionary('zlib', int.from_bytes(payload[2:6], 'big'),
+                              zlib.adler32(zdict) if zdict else None)
+        try:
+            decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+            data = decompressor.decompress(payload) + decompressor.flush()
+        except zlib.error as e:
+            raise TranscriptDecompressionError(f"Corrupt zlib transcript: {e}")
+    return data.decode('utf-8')
+
+
+def _check_dictionary(codec: str, needed: int, configured: Optional[int]) -> None:
+    if needed == configured:
+        return
+    current = f"the configured one has id {configured}" if configured else "none is configured"
+    raise TranscriptDecompressionError(
+        f"Transcript was compressed with {codec} dictionary id {needed} but {current}; "
+        f"restore that dictionary in TRANSCRIPT_COMPRESSION_DICT to read it"
+    )
+
+
+def export_transcript_bytes(text: str) -> bytes:
+    """Encode a transcript for export.
+
+    Exports use plain gzip (no shared dictionary) so that any consumer can read
+    them without access to our dictionary.
+    """
+    return gzip.compress(text.encode('utf-8'), mtime=0)
+
+
+def export_extension() -> str:
+    return '.txt.gz' if compression_enabled() else '.txt'
+
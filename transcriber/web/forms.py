@@ -1,5 +1,6 @@
 from django import forms
 from .models import TranscriptionJob
+from .services.archive_service import is_archive, is_supported_audio
 
 
 class TranscriptionForm(forms.ModelForm):
@@ -9,3 +10,52 @@ class TranscriptionForm(forms.ModelForm):
         widgets = {
             'speaker_count': forms.NumberInput(attrs={'min': 1, 'max': 10}),
         }
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('widget', MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        single_file_clean = super().clean
+        if isinstance(data, (list, tuple)):
+            return [single_file_clean(d, initial) for d in data]
+        if not data:
+            return []
+        return [single_file_clean(data, initial)]
+
+
+class BulkTranscriptionForm(forms.Form):
+    audio_files = MultipleFileField(required=False)
+    archives = MultipleFileField(required=False)
+    speaker_count = forms.IntegerField(
+        required=False, initial=2, min_value=1, max_value=10,
+        widget=forms.NumberInput(attrs={'min': 1, 'max': 10}),
+    )
+
+    def clean_audio_files(self):
+        files = self.cleaned_data['audio_files']
+        for f in files:
+            if not is_supported_audio(f.name):
+                raise forms.ValidationError(
+                    f"Unsupported audio format: {f.name}. Supported formats are: WAV, MP3, FLAC, OGG"
+                )
+        return files
+
+    def clean_archives(self):
+        archives = self.cleaned_data['archives']
+        for f in archives:
+            if not is_archive(f.name):
+                raise forms.ValidationError(f"Unsupported archive format: {f.name}. Use ZIP or TAR")
+        return archives
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get('audio_files') and not cleaned_data.get('archives'):
+            raise forms.ValidationError("Upload at least one audio file or archive.")
+        return cleaned_data
@@ -0,0 +1,87 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from transcriber.web.compression import (
+    ZLIB_MAX_DICT_SIZE, compress_transcript, decompress_transcript, zstandard,
+)
+from transcriber.web.models import TranscriptionJob
+
+
+class Command(BaseCommand):
+    help = "Compare size and latency of transcript storage codecs against plain text"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=1000,
+                            help="Number of most recent transcripts to benchmark (default: 1000)")
+        parser.add_argument('--repeat', type=int, default=5,
+                            help="Timing repetitions per transcript (default: 5)")
+
+    def handle(self, *args, **options):
+        jobs = (TranscriptionJob.objects
+                .filter(status='completed')
+                .only('id', 'transcript', 'transcript_compressed')[:options['samples']])
+        texts = [job.transcript_text for job in jobs if job.transcript_text]
+        if len(texts) < 2:
+            raise CommandError("Need at least two completed transcripts to benchmark")
+
+        # Train dictionaries on one half and measure on the other, so the
+        # dictionary never sees the text it is compressing
+        train, test = texts[::2], texts[1::2]
+        dictionary = self._build_dictionary(train)
+
+        configs = [('none', None, None), ('zlib', 'zlib', b''), ('zlib+dict', 'zlib', dictionary)]
+        if zstandard is not None:
+            configs += [('zstd', 'zstd', b''), ('zstd+dict', 'zstd', dictionary)]
+        else:
+            self.stdout.write("zstandard is not installed; skipping zstd codecs")
+
+        repeat = options['repeat']
+        raw_size = sum(len(t.encode('utf-8')) for t in test)
+        self.stdout.write(f"{len(test)} transcripts, {raw_size} bytes uncompressed, "
+                          f"dictionary trained on {len(train)}")
+        self.stdout.write(f"{'codec':<10} {'bytes':>12} {'ratio':>7} {'write us':>10} {'read us':>10}")
+        for label, codec, dict_data in configs:
+            size, write_us, read_us = self._measure(test, codec, dict_data, repeat)
+            self.stdout.write(
+                f"{label:<10} {size:>12} {raw_size / size:>7.2f} {write_us:>10.1f} {read_us:>10.1f}"
+            )
+
+    @staticmethod
+    def _build_dictionary(texts):
+        samples = [t.encode('utf-8') for t in texts]
+        if zstandard is not None:
+            try:
+                return zstandard.train_dictionary(ZLIB_MAX_DICT_SIZE, samples).as_bytes()
+            except zstandard.ZstdError:
+                pass
+        # Classic zlib preset dictionary: recent sample text, most common last
+        return b'\n'.join(samples)[-ZLIB_MAX_DICT_SIZE:]
+
+    @staticmethod
+    def _measure(texts, codec, dict_data, repeat):
+        """Return total stored bytes and mean per-transcript write/read microseconds"""
+        if codec is None:
+            encode = lambda text: text.encode('utf-8')
+            decode = lambda payload: payload.decode('utf-8')
+        else:
+            encode = lambda text: compress_transcript(text, codec=codec, dictionary=dict_data)
+            decode = lambda payload: decompress_transcript(payload, dictionary=dict_data)
+
+        payloads = [encode(text) for text in texts]
+        if [decode(p) for p in payloads] != texts:
+            raise CommandError(f"Round trip failed for codec {codec}")
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                encode(text)
+        write_us = (time.perf_counter() - start) * 1e6 / (repeat * len(texts))
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for payload in payloads:
+                decode(payload)
+        read_us = (time.perf_counter() - start) * 1e6 / (repeat * len(texts))
+
+        return sum(len(p) for p in payloads), write_us, read_us
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from transcriber.web.compression import (
+    TranscriptDecompressionError, compression_enabled, decompress_transcript,
+)
+from transcriber.web.models import TranscriptionJob
+
+
+class Command(BaseCommand):
+    help = "Compress existing plain-text transcripts with the configured TRANSCRIPT_COMPRESSION codec"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Rows read and written per query (default: 500)")
+        parser.add_argument('--decompress', action='store_true',
+                            help="Move compressed transcripts back to plain text instead")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if options['decompress']:
+            queryset = TranscriptionJob.objects.filter(transcript_compressed__isnull=False)
+            fields = ('id', 'transcript_compressed')
+            convert = self._decompress
+        else:
+            if not compression_enabled():
+                raise CommandError("Set TRANSCRIPT_COMPRESSION to 'zlib' or 'zstd' first")
+            queryset = TranscriptionJob.objects.filter(transcript__isnull=False)
+            fields = ('id', 'transcript')
+            convert = self._compress
+
+        converted = 0
+        last_id = 0
+        while True:
+            # Keyset pagination on id; converted rows drop out of the filter anyway
+            jobs = list(queryset.filter(id__gt=last_id).order_by('id').only(*fields)[:batch_size])
+            if not jobs:
+                break
+            for job in jobs:
+                try:
+                    convert(job)
+                except TranscriptDecompressionError as e:
+                    raise CommandError(f"Job {job.id}: {e}")
+            TranscriptionJob.objects.bulk_update(jobs, ['transcript', 'transcript_compressed'])
+            converted += len(jobs)
+            last_id = jobs[-1].id
+            self.stdout.write(f"Converted {converted} transcripts...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {converted} transcripts converted"))
+
+    @staticmethod
+    def _compress(job):
+        job.transcript_text = job.transcript
+
+    @staticmethod
+    def _decompress(job):
+        job.transcript = decompress_transcript(job.transcript_compressed)
+        job.transcript_compressed = None
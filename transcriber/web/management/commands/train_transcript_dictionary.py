@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from transcriber.web.compression import zstandard
+from transcriber.web.models import TranscriptionJob
+
+
+class Command(BaseCommand):
+    help = "Train a shared compression dictionary from existing transcripts"
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', nargs='?', default=settings.TRANSCRIPT_COMPRESSION_DICT,
+                            help="Where to write the dictionary (default: TRANSCRIPT_COMPRESSION_DICT)")
+        parser.add_argument('--samples', type=int, default=2000,
+                            help="Number of most recent transcripts to train on (default: 2000)")
+        parser.add_argument('--size', type=int, default=32 * 1024,
+                            help="Dictionary size in bytes (default: 32768, the zlib window)")
+
+    def handle(self, *args, **options):
+        if zstandard is None:
+            raise CommandError("Dictionary training requires the zstandard package")
+        if not options['output']:
+            raise CommandError("Pass an output path or set TRANSCRIPT_COMPRESSION_DICT")
+
+        jobs = (TranscriptionJob.objects
+                .filter(status='completed')
+                .only('id', 'transcript', 'transcript_compressed')[:options['samples']])
+        samples = [job.transcript_text.encode('utf-8') for job in jobs if job.transcript_text]
+        if not samples:
+            raise CommandError("No completed transcripts to train on")
+
+        try:
+            dictionary = zstandard.train_dictionary(options['size'], samples)
+        except zstandard.ZstdError as e:
+            raise CommandError(f"Training failed ({len(samples)} samples): {e}")
+
+        with open(options['output'], 'wb') as f:
+            f.write(dictionary.as_bytes())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(dictionary.as_bytes())} byte dictionary trained on "
+            f"{len(samples)} transcripts to {options['output']}"
+        ))
+        self.stdout.write(
+            "Transcripts already compressed with a previous dictionary must be decompressed "
+            "(compress_transcripts --decompress) before switching to this one."
+        )
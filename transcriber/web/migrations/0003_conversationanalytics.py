@@ -0,0 +1,39 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0002_transcriptionbatch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConversationAnalytics",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="analytics",
+                        serialize=False,
+                        to="web.transcriptionjob",
+                    ),
+                ),
+                ("computed_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("duration_seconds", models.FloatField()),
+                ("word_count", models.IntegerField()),
+                ("turn_count", models.IntegerField()),
+                ("speaker_count", models.IntegerField()),
+                ("words_per_minute", models.FloatField()),
+                ("overlap_seconds", models.FloatField()),
+                ("speakers", models.JSONField(default=dict)),
+            ],
+            options={
+                "ordering": ["-computed_at"],
+            },
+        ),
+    ]
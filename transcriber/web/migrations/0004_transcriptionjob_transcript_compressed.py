@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0003_conversationanalytics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transcriptionjob",
+            name="transcript_compressed",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
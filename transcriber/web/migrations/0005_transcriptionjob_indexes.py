@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0004_transcriptionjob_transcript_compressed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transcriptionjob",
+            index=models.Index(fields=["created_at", "id"], name="web_job_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transcriptionjob",
+            index=models.Index(fields=["status", "created_at"], name="web_job_status_created_idx"),
+        ),
+    ]
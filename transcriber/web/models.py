@@ -1,5 +1,32 @@
 from django.db import models
+from django.db.models import Count
 from django.utils import timezone
+from .compression import compress_transcript, compression_enabled, decompress_transcript
+
+
+class TranscriptionBatch(models.Model):
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Transcription Batch {self.id}"
+
+    def progress(self):
+        """Aggregate job counts per status for this batch"""
+        counts = {status: 0 for status, _ in TranscriptionJob.STATUS_CHOICES}
+        for row in self.jobs.values('status').annotate(total=Count('id')):
+            counts[row['status']] = row['total']
+        total = sum(counts.values())
+        finished = counts['completed'] + counts['failed']
+        return {
+            'total': total,
+            'counts': counts,
+            'finished': finished,
+            'percent': round(100 * finished / total, 1) if total else 0.0,
+            'done': total > 0 and finished == total,
+        }
 
 
 class TranscriptionJob(models.Model):
@@ -14,11 +41,70 @@ class TranscriptionJob(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     transcript = models.TextField(blank=True, null=True)
+    # Set instead of `transcript` when TRANSCRIPT_COMPRESSION is enabled
+    transcript_compressed = models.BinaryField(blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
     speaker_count = models.IntegerField(default=2)
+    batch = models.ForeignKey(
+        TranscriptionBatch,
+        on_delete=models.SET_NULL,
+        related_name='jobs',
+        blank=True,
+        null=True,
+    )
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination for the job listing
+            models.Index(fields=['created_at', 'id'], name='web_job_created_id_idx'),
+            models.Index(fields=['status', 'created_at'], name='web_job_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"Transcription Job {self.id} - {self.status}"
+
+    @property
+    def transcript_text(self):
+        """The transcript, decompressed if it is stored compressed.
+
+        Raises TranscriptDecompressionError if the stored payload cannot be read
+        with the configured dictionary.
+        """
+        if self.transcript_compressed is not None:
+            return decompress_transcript(self.transcript_compressed)
+        return self.transcript
+
+    @transcript_text.setter
+    def transcript_text(self, value):
+        if value is not None and compression_enabled():
+            self.transcript_compressed = compress_transcript(value)
+            self.transcript = None
+        else:
+            self.transcript_compressed = None
+            self.transcript = value
+
+
+class ConversationAnalytics(models.Model):
+    """Conversation aggregates computed once when a job completes"""
+    job = models.OneToOneField(
+        TranscriptionJob,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='analytics',
+    )
+    computed_at = models.DateTimeField(default=timezone.now)
+    duration_seconds = models.FloatField()
+    word_count = models.IntegerField()
+    turn_count = models.IntegerField()
+    speaker_count = models.IntegerField()
+    words_per_minute = models.FloatField()
+    overlap_seconds = models.FloatField()
+    # Per speaker tag: talk_time_seconds, word_count, turn_count, words_per_minute
+    speakers = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ['-computed_at']
+
+    def __str__(self):
+        return f"Conversation Analytics for Job {self.job_id}"
@@ -0,0 +1,76 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (speaker_tag, start_seconds, end_seconds) for each recognised word, in order
+WordTiming = Tuple[int, float, float]
+
+
+def compute_conversation_analytics(words: Sequence[WordTiming]) -> Optional[Dict]:
+    """Compute per-conversation aggregates from diarized word timings.
+
+    Everything is derived in one vectorized pass over the word array, so the
+    cost is independent of how the transcript text is formatted.
+
+    Args:
+        words: Word timings as (speaker_tag, start_seconds, end_seconds) tuples
+
+    Returns:
+        dict: Totals plus a ``speakers`` mapping of per-speaker stats, or None
+        if there are no words
+    """
+    if not words:
+        return None
+
+    data = np.asarray(words, dtype=np.float64)
+    speakers = data[:, 0].astype(np.int64)
+    starts = data[:, 1]
+    ends = np.maximum(data[:, 2], starts)
+    durations = ends - starts
+
+    labels, index = np.unique(speakers, return_inverse=True)
+    n_speakers = len(labels)
+
+    # A turn starts on the first word and on every change of speaker
+    turn_starts = np.empty(len(speakers), dtype=bool)
+    turn_starts[0] = True
+    np.not_equal(speakers[1:], speakers[:-1], out=turn_starts[1:])
+
+    talk_time = np.bincount(index, weights=durations, minlength=n_speakers)
+    word_counts = np.bincount(index, minlength=n_speakers)
+    turn_counts = np.bincount(index[turn_starts], minlength=n_speakers)
+
+    # Overlap: how far each word runs into speech from the *other* speakers.
+    # Keep a running latest end time per speaker (one column each), then hide
+    # the word's own speaker so talking over yourself never counts.
+    ends_by_speaker = np.full((len(speakers), n_speakers), -np.inf)
+    ends_by_speaker[np.arange(len(speakers)), index] = ends
+    latest_end = np.maximum.accumulate(ends_by_speaker, axis=0)[:-1]
+    latest_end[np.arange(len(speakers) - 1), index[1:]] = -np.inf
+    others_end = latest_end.max(axis=1)
+    overlap = np.clip(np.minimum(others_end, ends[1:]) - starts[1:], 0, None)
+    overlap_seconds = float(overlap.sum())
+
+    duration = float(ends.max() - starts.min())
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speaker_wpm = np.where(talk_time > 0, word_counts * 60.0 / talk_time, 0.0)
+
+    return {
+        'duration_seconds': round(duration, 3),
+        'word_count': int(len(speakers)),
+        'turn_count': int(turn_starts.sum()),
+        'speaker_count': int(n_speakers),
+        'words_per_minute': round(len(speakers) * 60.0 / duration, 2) if duration > 0 else 0.0,
+        'overlap_seconds': round(overlap_seconds, 3),
+        'speakers': {
+            str(label): {
+                'talk_time_seconds': round(float(talk), 3),
+                'word_count': int(count),
+                'turn_count': int(turns),
+                'words_per_minute': round(float(wpm), 2),
+            }
+            for label, talk, count, turns, wpm in zip(
+                labels, talk_time, word_counts, turn_counts, speaker_wpm
+            )
+        },
+    }
@@ -0,0 +1,138 @@
+import os
+import tarfile
+import zipfile
+import zlib
+from typing import IO, Iterator, Optional, Tuple
+
+# Keep in sync with TranscriptionService._get_audio_encoding
+SUPPORTED_AUDIO_EXTENSIONS = {'.wav', '.mp3', '.flac', '.ogg'}
+
+ZIP_EXTENSIONS = ('.zip',)
+TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+# What corrupt or truncated archives raise, either while listing members or
+# while a member is being read (CRC mismatch, cut-off compressed stream, ...)
+ARCHIVE_ERRORS = (zipfile.BadZipFile, tarfile.TarError, zlib.error, EOFError, OSError)
+
+
+def is_supported_audio(name: str) -> bool:
+    """Check whether a file name has an extension we can transcribe"""
+    return os.path.splitext(name)[1].lower() in SUPPORTED_AUDIO_EXTENSIONS
+
+
+def is_archive(name: str) -> bool:
+    """Check whether a file name looks like a ZIP or TAR archive"""
+    name = name.lower()
+    return name.endswith(ZIP_EXTENSIONS) or name.endswith(TAR_EXTENSIONS)
+
+
+class ExtractionBudget:
+    """Caps how many files and bytes a single upload may write to storage.
+
+    Archives are tiny compared to what they can expand to, so the byte budget
+    is charged while members are copied rather than trusted from headers.
+    """
+
+    def __init__(self, max_files: int, max_bytes: int):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.files = 0
+        self.bytes = 0
+
+    def add_file(self) -> None:
+        self.files += 1
+        if self.files > self.max_files:
+            raise ValueError(f"Upload contains more than {self.max_files} audio files")
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes += count
+        if self.bytes > self.max_bytes:
+            raise ValueError(f"Upload expands to more than {self.max_bytes} bytes of audio")
+
+
+class _MemberReader:
+    """Read-only wrapper around an archive member.
+
+    Charges every byte read to the budget, if any, and turns read errors from
+    a corrupt member into ValueError. Members are read by the caller, after
+    iter_audio_members has yielded them, so its own error handling never sees
+    these errors.
+    """
+
+    def __init__(self, fileobj: IO[bytes], archive_name: str, budget: Optional[ExtractionBudget]):
+        self._fileobj = fileobj
+        self._archive_name = archive_name
+        self._budget = budget
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            data = self._fileobj.read(size)
+        except ARCHIVE_ERRORS as e:
+            raise ValueError(f"Could not read archive {self._archive_name}: {e}")
+        if self._budget:
+            self._budget.add_bytes(len(data))
+        return data
+
+
+def _iter_zip(fileobj: IO[bytes], budget: Optional[ExtractionBudget]) -> Iterator[Tuple[str, IO[bytes]]]:
+    with zipfile.ZipFile(fileobj) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            name = os.path.basename(info.filename)
+            if not is_supported_audio(name):
+                continue
+            if budget:
+                budget.add_file()
+                # Fail fast on honest headers; the reader enforces the real size
+                if budget.bytes + info.file_size > budget.max_bytes:
+                    raise ValueError(f"Upload expands to more than {budget.max_bytes} bytes of audio")
+            with archive.open(info) as member:
+                yield name, _MemberReader(member, fileobj.name, budget)
+
+
+def _iter_tar(fileobj: IO[bytes], budget: Optional[ExtractionBudget]) -> Iterator[Tuple[str, IO[bytes]]]:
+    # 'r|*' reads the archive strictly sequentially (with transparent
+    # decompression), so members are never buffered in full.
+    with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            name = os.path.basename(member.name)
+            if not is_supported_audio(name):
+                continue
+            extracted = archive.extractfile(member)
+            if extracted is not None:
+                if budget:
+                    budget.add_file()
+                yield name, _MemberReader(extracted, fileobj.name, budget)
+
+
+def iter_audio_members(uploaded_file,
+                       budget: Optional[ExtractionBudget] = None) -> Iterator[Tuple[str, IO[bytes]]]:
+    """Stream the supported audio members out of an uploaded ZIP or TAR archive.
+
+    Each member is yielded as a (basename, file object) pair. The file object is
+    only valid until the next item is requested, so callers must consume it
+    (e.g. hand it to storage) before advancing the iterator. Directory
+    components are stripped from member names so archives cannot write outside
+    the upload directory.
+
+    Args:
+        uploaded_file: The uploaded archive (any readable binary file object with a name)
+        budget (ExtractionBudget): Optional limit on members and bytes extracted
+
+    Raises:
+        ValueError: If the file is not a readable ZIP or TAR archive, or the
+            budget is exceeded
+    """
+    name = uploaded_file.name.lower()
+    try:
+        if name.endswith(ZIP_EXTENSIONS):
+            yield from _iter_zip(uploaded_file, budget)
+        elif name.endswith(TAR_EXTENSIONS):
+            yield from _iter_tar(uploaded_file, budget)
+        else:
+            raise ValueError(f"Unsupported archive format: {uploaded_file.name}")
+    except ARCHIVE_ERRORS as e:
+        raise ValueError(f"Could not read archive {uploaded_file.name}: {e}")
@@ -2,10 +2,11 @@ from google.cloud import speech_v1
 from google.cloud import storage
 import os
 from dotenv import load_dotenv
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import time
+from ..compression import compression_enabled, export_extension, export_transcript_bytes
 
 load_dotenv()
 
@@ -17,6 +18,8 @@ class TranscriptionResult:
     duration: float
     created_at: datetime
     error: Optional[str] = None
+    # (speaker_tag, start_seconds, end_seconds) per word, for conversation analytics
+    words: List[Tuple[int, float, float]] = field(default_factory=list)
 
 class TranscriptionService:
     def __init__(self):
@@ -108,7 +111,12 @@ class TranscriptionService:
             print(f"Warning: Could not delete temporary GCS file: {e}")
 
     def _save_transcript_to_file(self, transcript: str, original_filename: str) -> str:
-        """Save transcript to a file locally and to GCS completed_transcriptions folder"""
+        """Save transcript to a file locally and to GCS completed_transcriptions folder.
+
+        With TRANSCRIPT_COMPRESSION enabled both copies are gzip-compressed. The
+        GCS object is tagged with Content-Encoding: gzip so downloads are
+        decompressed transparently.
+        """
         output_path = os.getenv('OUTPUT_PATH', 'transcripts/')
         
         # Create output directory if it doesn't exist
@@ -117,18 +125,22 @@ class TranscriptionService:
         # Create filename based on original audio file
         base_name = os.path.splitext(os.path.basename(original_filename))[0]
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_filename = f"{base_name}_{timestamp}.txt"
+        compress = compression_enabled()
+        output_filename = f"{base_name}_{timestamp}{export_extension()}"
         output_file = os.path.join(output_path, output_filename)
+        data = export_transcript_bytes(transcript) if compress else transcript.encode('utf-8')
         
         # Save transcript locally
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(transcript)
+        with open(output_file, 'wb') as f:
+            f.write(data)
             
         # Upload to GCS completed_transcriptions folder
         try:
             bucket = self.storage_client.bucket(self.bucket_name)
             blob = bucket.blob(f"completed_transcriptions/{output_filename}")
-            blob.upload_from_string(transcript)
+            if compress:
+                blob.content_encoding = 'gzip'
+            blob.upload_from_string(data, content_type='text/plain; charset=utf-8')
             print(f"Uploaded transcript to gs://{self.bucket_name}/completed_transcriptions/{output_filename}")
         except Exception as e:
             print(f"Warning: Could not upload transcript to GCS: {e}")
@@ -170,6 +182,7 @@ class TranscriptionService:
                 encoding=encoding,
                 sample_rate_hertz=sample_rate,
                 language_code=os.getenv('LANGUAGE_CODE', 'en-US'),
+                enable_word_time_offsets=True,
                 diarization_config=diarization_config
             )
 
@@ -192,9 +205,15 @@ class TranscriptionService:
             current_speaker = None
             current_line = []
             speaker_set = set()
+            words = []
 
             for word_info in words_info:
                 speaker_set.add(word_info.speaker_tag)
+                words.append((
+                    word_info.speaker_tag,
+                    word_info.start_time.total_seconds(),
+                    word_info.end_time.total_seconds(),
+                ))
                 if word_info.speaker_tag != current_speaker:
                     if current_line:
                         transcript_lines.append(f"Speaker {current_speaker}: {' '.join(current_line)}")
@@ -216,7 +235,8 @@ class TranscriptionService:
                 transcript=transcript,
                 speakers=len(speaker_set),
                 duration=(datetime.now() - start_time).total_seconds(),
-                created_at=datetime.now()
+                created_at=datetime.now(),
+                words=words
             )
 
         except Exception as e:
@@ -0,0 +1,38 @@
+"""In-memory archives for upload tests"""
+import io
+import tarfile
+import zipfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+
+def make_zip(members, name='upload.zip', compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as archive:
+        for member_name, data in members:
+            archive.writestr(member_name, data)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+def make_tar(members, name='upload.tar.gz', mode='w:gz'):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as archive:
+        for member_name, data in members:
+            info = tarfile.TarInfo(member_name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+def corrupt_zip(members, damaged_member, name='upload.zip'):
+    """A stored (uncompressed) ZIP whose damaged_member fails its CRC check"""
+    content = make_zip(members, name, compression=zipfile.ZIP_STORED).read()
+    data = dict(members)[damaged_member]
+    offset = content.index(data)
+    flipped = bytes([content[offset] ^ 0xFF])
+    return SimpleUploadedFile(name, content[:offset] + flipped + content[offset + 1:])
+
+
+def truncated_tar(members, name='upload.tgz'):
+    content = make_tar(members, name).read()
+    return SimpleUploadedFile(name, content[:len(content) // 2])
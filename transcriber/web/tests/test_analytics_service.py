@@ -0,0 +1,73 @@
+import warnings
+
+from django.test import SimpleTestCase
+
+from transcriber.web.services.analytics_service import compute_conversation_analytics
+
+
+class ComputeConversationAnalyticsTests(SimpleTestCase):
+    def test_empty_input(self):
+        self.assertIsNone(compute_conversation_analytics([]))
+
+    def test_single_word(self):
+        analytics = compute_conversation_analytics([(1, 2.0, 2.5)])
+
+        self.assertEqual(analytics['word_count'], 1)
+        self.assertEqual(analytics['turn_count'], 1)
+        self.assertEqual(analytics['speaker_count'], 1)
+        self.assertEqual(analytics['duration_seconds'], 0.5)
+        self.assertEqual(analytics['words_per_minute'], 120.0)
+        self.assertEqual(analytics['overlap_seconds'], 0.0)
+        self.assertEqual(analytics['speakers'], {
+            '1': {'talk_time_seconds': 0.5, 'word_count': 1, 'turn_count': 1, 'words_per_minute': 120.0},
+        })
+
+    def test_speaker_change_with_overlap(self):
+        analytics = compute_conversation_analytics([(1, 0, 1), (1, 1, 2), (2, 1.5, 3), (1, 2.5, 3.5)])
+
+        self.assertEqual(analytics['word_count'], 4)
+        self.assertEqual(analytics['turn_count'], 3)
+        self.assertEqual(analytics['speaker_count'], 2)
+        self.assertEqual(analytics['duration_seconds'], 3.5)
+        self.assertEqual(analytics['overlap_seconds'], 1.0)
+        self.assertEqual(analytics['speakers']['1']['turn_count'], 2)
+        self.assertEqual(analytics['speakers']['1']['word_count'], 3)
+        self.assertEqual(analytics['speakers']['1']['talk_time_seconds'], 3.0)
+        self.assertEqual(analytics['speakers']['2']['turn_count'], 1)
+        self.assertEqual(analytics['speakers']['2']['talk_time_seconds'], 1.5)
+
+    def test_overlap_with_own_earlier_words_is_ignored(self):
+        # Speaker 1 backchannels inside speaker 2's long word; speaker 2 then
+        # resumes while their own long word is still "running"
+        analytics = compute_conversation_analytics([(2, 0, 10), (1, 3, 4), (2, 5, 6)])
+
+        self.assertEqual(analytics['overlap_seconds'], 1.0)
+        self.assertEqual(analytics['turn_count'], 3)
+
+    def test_overlap_counts_every_word_spoken_over_another_speaker(self):
+        analytics = compute_conversation_analytics([(1, 0, 10), (2, 2, 3), (2, 3, 4), (3, 3.5, 5)])
+
+        self.assertEqual(analytics['overlap_seconds'], 3.5)
+
+    def test_overlap_within_one_speaker_is_ignored(self):
+        analytics = compute_conversation_analytics([(1, 0, 2), (1, 1, 3)])
+
+        self.assertEqual(analytics['overlap_seconds'], 0.0)
+        self.assertEqual(analytics['turn_count'], 1)
+
+    def test_zero_duration_words_do_not_divide_by_zero(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            analytics = compute_conversation_analytics([(1, 0, 1), (2, 1, 1), (2, 1, 0.5)])
+
+        self.assertEqual(analytics['speakers']['2']['talk_time_seconds'], 0.0)
+        self.assertEqual(analytics['speakers']['2']['words_per_minute'], 0.0)
+        self.assertEqual(analytics['speakers']['1']['words_per_minute'], 60.0)
+
+    def test_all_zero_duration_words(self):
+        analytics = compute_conversation_analytics([(1, 4, 4), (2, 4, 4)])
+
+        self.assertEqual(analytics['duration_seconds'], 0.0)
+        self.assertEqual(analytics['words_per_minute'], 0.0)
+        self.assertEqual(analytics['overlap_seconds'], 0.0)
+        self.assertEqual(analytics['turn_count'], 2)
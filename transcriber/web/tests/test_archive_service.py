@@ -0,0 +1,71 @@
+from django.test import SimpleTestCase
+
+from transcriber.web.services.archive_service import ExtractionBudget, iter_audio_members
+
+from .archives import corrupt_zip, make_tar, make_zip, truncated_tar
+
+
+def _extract(uploaded, budget=None):
+    return [(name, member.read()) for name, member in iter_audio_members(uploaded, budget)]
+
+
+class IterAudioMembersTests(SimpleTestCase):
+    def test_zip_strips_directories_and_skips_non_audio(self):
+        uploaded = make_zip([
+            ('station/a.wav', b'one'), ('notes.txt', b'skip'), ('../../b.MP3', b'two'), ('dir/', b''),
+        ])
+
+        self.assertEqual(_extract(uploaded), [('a.wav', b'one'), ('b.MP3', b'two')])
+
+    def test_tar_streams_members(self):
+        for mode, name in (('w', 'day.tar'), ('w:gz', 'day.tgz'), ('w:bz2', 'day.tar.bz2')):
+            with self.subTest(name=name):
+                uploaded = make_tar([('x/c.flac', b'three'), ('readme', b'skip'), ('d.ogg', b'four')], name, mode)
+
+                self.assertEqual(_extract(uploaded), [('c.flac', b'three'), ('d.ogg', b'four')])
+
+    def test_unknown_extension_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'Unsupported archive format'):
+            _extract(make_zip([('a.wav', b'1')], name='upload.rar'))
+
+    def test_corrupt_zip_member_raises_value_error(self):
+        uploaded = corrupt_zip([('a.wav', b'good audio'), ('b.wav', b'damaged audio')], 'b.wav')
+
+        with self.assertRaisesRegex(ValueError, 'Could not read archive'):
+            _extract(uploaded)
+
+    def test_truncated_tar_raises_value_error(self):
+        uploaded = truncated_tar([(f'{i}.wav', bytes(range(256)) * 64) for i in range(8)])
+
+        with self.assertRaisesRegex(ValueError, 'Could not read archive'):
+            _extract(uploaded)
+
+
+class ExtractionBudgetTests(SimpleTestCase):
+    def test_file_limit(self):
+        budget = ExtractionBudget(max_files=2, max_bytes=10 ** 6)
+
+        with self.assertRaisesRegex(ValueError, 'more than 2 audio files'):
+            _extract(make_tar([('a.wav', b'1'), ('b.wav', b'2'), ('c.wav', b'3')]), budget)
+
+    def test_byte_limit_is_enforced_while_reading(self):
+        # TAR headers are not checked up front, so this exercises the reader
+        budget = ExtractionBudget(max_files=10, max_bytes=1000)
+
+        with self.assertRaisesRegex(ValueError, 'more than 1000 bytes'):
+            _extract(make_tar([('a.wav', b'\0' * 600), ('b.wav', b'\0' * 600)]), budget)
+        self.assertGreater(budget.bytes, 1000)
+
+    def test_zip_declared_size_fails_fast(self):
+        budget = ExtractionBudget(max_files=10, max_bytes=1000)
+        members = iter_audio_members(make_zip([('a.wav', b'\0' * 5000)]), budget)
+
+        with self.assertRaisesRegex(ValueError, 'more than 1000 bytes'):
+            next(members)
+        self.assertEqual(budget.bytes, 0)
+
+    def test_within_budget(self):
+        budget = ExtractionBudget(max_files=2, max_bytes=6)
+
+        self.assertEqual(len(_extract(make_zip([('a.wav', b'123'), ('b.wav', b'456')]), budget)), 2)
+        self.assertEqual((budget.files, budget.bytes), (2, 6))
@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from transcriber.web.forms import BulkTranscriptionForm
+from transcriber.web.models import TranscriptionBatch, TranscriptionJob
+
+from .archives import corrupt_zip, make_tar, make_zip, truncated_tar
+
+
+class BulkUploadTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        executor = mock.patch('transcriber.web.views.batch_executor')
+        self.executor = executor.start()
+        self.addCleanup(executor.stop)
+
+    def _stored_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(root, name), self.media_root)
+            for root, _, files in os.walk(self.media_root) for name in files
+        )
+
+    def _post(self, limits=None, **data):
+        with mock.patch.dict(os.environ, limits or {}):
+            return self.client.post('/batch/', data)
+
+    def test_creates_batch_from_files_and_archives(self):
+        response = self._post(
+            audio_files=[SimpleUploadedFile('direct.wav', b'direct')],
+            archives=[
+                make_zip([('station/a.wav', b'a'), ('notes.txt', b'skip')]),
+                make_tar([('b.mp3', b'b'), ('c.flac', b'c')]),
+            ],
+            speaker_count=3,
+        )
+
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        jobs = TranscriptionJob.objects.filter(batch_id=data['batch_id']).order_by('id')
+        self.assertEqual(data['job_ids'], [job.id for job in jobs])
+        self.assertEqual(data['progress']['total'], 4)
+        self.assertEqual({job.speaker_count for job in jobs}, {3})
+        self.assertEqual(
+            sorted(os.path.basename(job.audio_file.name) for job in jobs),
+            ['a.wav', 'b.mp3', 'c.flac', 'direct.wav'],
+        )
+        self.assertEqual(jobs.get(audio_file__endswith='a.wav').audio_file.read(), b'a')
+        self.assertEqual(self.executor.submit.call_count, 4)
+
+        status = self.client.get(data['status_url']).json()
+        self.assertEqual(status['progress']['counts']['pending'], 4)
+        self.assertFalse(status['progress']['done'])
+        self.assertEqual([job['id'] for job in status['jobs']], data['job_ids'])
+
+    def test_same_names_in_concurrent_uploads_do_not_collide(self):
+        first = self._post(archives=[make_zip([('clip.wav', b'first')])]).json()
+        failed = self._post(
+            {'BULK_MAX_FILES': '1'}, archives=[make_zip([('clip.wav', b'second'), ('more.wav', b'x')])],
+        )
+
+        self.assertEqual(failed.status_code, 400)
+        job = TranscriptionJob.objects.get(id=first['job_ids'][0])
+        self.assertEqual(job.audio_file.read(), b'first')
+        self.assertEqual(self._stored_files(), [job.audio_file.name])
+
+    def test_file_limit(self):
+        response = self._post(
+            {'BULK_MAX_FILES': '2'}, archives=[make_tar([(f'{i}.wav', b'1') for i in range(3)])],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('more than 2 audio files', response.json()['error'])
+        self.assertEqual(self._stored_files(), [])
+        self.assertFalse(TranscriptionBatch.objects.exists())
+
+    def test_byte_limit_stops_compressible_member(self):
+        bomb = make_tar([('ok.wav', b'1'), ('bomb.wav', b'\0' * (8 * 1024 * 1024))])
+        self.assertLess(bomb.size, 64 * 1024)
+
+        response = self._post({'BULK_MAX_BYTES': str(1024 * 1024)}, archives=[bomb])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('bytes of audio', response.json()['error'])
+        self.assertEqual(self._stored_files(), [])
+        self.assertFalse(TranscriptionJob.objects.exists())
+
+    def test_corrupt_zip_is_rejected_and_cleaned_up(self):
+        uploaded = corrupt_zip([('a.wav', b'good audio'), ('b.wav', b'damaged audio')], 'b.wav')
+
+        response = self._post(archives=[uploaded])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Could not read archive', response.json()['error'])
+        self.assertEqual(self._stored_files(), [])
+
+    def test_truncated_tar_is_rejected_and_cleaned_up(self):
+        uploaded = truncated_tar([(f'{i}.wav', os.urandom(4096)) for i in range(8)])
+
+        response = self._post(archives=[uploaded])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Could not read archive', response.json()['error'])
+        self.assertEqual(self._stored_files(), [])
+
+    def test_archive_without_audio_is_rejected(self):
+        response = self._post(archives=[make_zip([('notes.txt', b'skip')])])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(TranscriptionBatch.objects.exists())
+
+
+class BulkTranscriptionFormTests(TestCase):
+    def _form(self, **files):
+        return BulkTranscriptionForm(data={}, files=files)
+
+    def test_requires_a_file(self):
+        form = self._form()
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('__all__', form.errors)
+
+    def test_rejects_unsupported_audio_and_archives(self):
+        self.assertIn('audio_files', self._form(audio_files=[SimpleUploadedFile('a.txt', b'1')]).errors)
+        self.assertIn('archives', self._form(archives=[SimpleUploadedFile('a.rar', b'1')]).errors)
+
+    def test_accepts_multiple_files(self):
+        form = self._form(audio_files=[SimpleUploadedFile('a.wav', b'1'), SimpleUploadedFile('b.ogg', b'2')])
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual([f.name for f in form.cleaned_data['audio_files']], ['a.wav', 'b.ogg'])
+        self.assertIsNone(form.cleaned_data['speaker_count'])
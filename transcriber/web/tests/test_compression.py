@@ -0,0 +1,140 @@
+import os
+import tempfile
+from datetime import datetime
+from unittest import mock, skipIf
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from transcriber.web.compression import (
+    TranscriptDecompressionError, check_configuration, compress_transcript, decompress_transcript, zstandard,
+)
+from transcriber.web.models import TranscriptionJob
+from transcriber.web.services.transcription_service import TranscriptionResult
+from transcriber.web.views import handle_transcription
+
+TEXT = "Speaker 1: fill up pump four please\nSpeaker 2: regular or premium\n" * 20
+DICTIONARY = b"Speaker 1: Speaker 2: pump regular premium diesel receipt card " * 50
+OTHER_DICTIONARY = b"Speaker 3: car wash total thanks okay " * 50
+
+
+class DecompressTranscriptTests(SimpleTestCase):
+    def test_zlib_round_trip_with_dictionary(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=DICTIONARY)
+
+        self.assertEqual(decompress_transcript(payload, dictionary=DICTIONARY), TEXT)
+
+    def test_zlib_payload_without_dictionary_ignores_configured_one(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=b'')
+
+        self.assertEqual(decompress_transcript(payload, dictionary=DICTIONARY), TEXT)
+
+    def test_zlib_missing_dictionary_is_reported(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=DICTIONARY)
+
+        with self.assertRaisesRegex(TranscriptDecompressionError, 'none is configured'):
+            decompress_transcript(payload, dictionary=b'')
+
+    def test_zlib_different_dictionary_is_reported(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=DICTIONARY)
+
+        with self.assertRaisesRegex(TranscriptDecompressionError, 'the configured one has id'):
+            decompress_transcript(payload, dictionary=OTHER_DICTIONARY)
+
+    def test_corrupt_payload_is_reported(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=b'')
+
+        with self.assertRaises(TranscriptDecompressionError):
+            decompress_transcript(payload[:-8] + b'garbage!', dictionary=b'')
+
+    @skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_different_dictionary_is_reported(self):
+        samples = [f"Speaker {i % 2 + 1}: pump {i} regular please".encode() for i in range(400)]
+        trained = zstandard.train_dictionary(1024, samples).as_bytes()
+        payload = compress_transcript(TEXT, codec='zstd', dictionary=trained)
+
+        self.assertEqual(decompress_transcript(payload, dictionary=trained), TEXT)
+        with self.assertRaisesRegex(TranscriptDecompressionError, 'zstd dictionary id'):
+            decompress_transcript(payload, dictionary=b'')
+
+    @skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_different_raw_dictionary_is_reported(self):
+        # Raw-content dictionaries carry no id, so only the checksum can tell
+        payload = compress_transcript(TEXT, codec='zstd', dictionary=DICTIONARY)
+
+        self.assertEqual(decompress_transcript(payload, dictionary=DICTIONARY), TEXT)
+        with self.assertRaisesRegex(TranscriptDecompressionError, 'different dictionary'):
+            decompress_transcript(payload, dictionary=OTHER_DICTIONARY)
+
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='/missing/transcripts.dict')
+    def test_missing_dictionary_file_on_read_is_reported(self):
+        payload = compress_transcript(TEXT, codec='zlib', dictionary=b'')
+
+        with self.assertRaisesRegex(TranscriptDecompressionError, 'Could not load the transcript dictionary'):
+            decompress_transcript(payload)
+
+
+class CheckConfigurationTests(SimpleTestCase):
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='/missing/transcripts.dict')
+    def test_missing_dictionary_file(self):
+        with self.assertRaisesRegex(ImproperlyConfigured, 'missing or unreadable'):
+            check_configuration()
+
+    @override_settings(TRANSCRIPT_COMPRESSION='brotli', TRANSCRIPT_COMPRESSION_DICT='')
+    def test_unknown_codec(self):
+        with self.assertRaises(ImproperlyConfigured):
+            check_configuration()
+
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='')
+    def test_valid_configuration(self):
+        check_configuration()
+
+
+class HandleTranscriptionStorageTests(TestCase):
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='/missing/transcripts.dict')
+    @mock.patch('transcriber.web.views.TranscriptionService')
+    def test_compression_failure_keeps_transcript(self, service_class):
+        service_class.return_value.transcribe_file.return_value = TranscriptionResult(
+            transcript=TEXT, speakers=2, duration=1.0, created_at=datetime.now(),
+        )
+        job = TranscriptionJob.objects.create(audio_file='audio/a.wav')
+
+        with self.assertLogs('transcriber.web.views', level='ERROR'):
+            handle_transcription(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.transcript, TEXT)
+        self.assertIsNone(job.transcript_compressed)
+
+
+class TranscriptDictionaryMismatchViewTests(TestCase):
+    def setUp(self):
+        handle, self.dict_path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as f:
+            f.write(DICTIONARY)
+        self.addCleanup(os.remove, self.dict_path)
+        with override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT=self.dict_path):
+            self.job = TranscriptionJob(audio_file='audio/a.wav', status='completed')
+            self.job.transcript_text = TEXT
+            self.job.save()
+
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='')
+    def test_check_status_reports_mismatch(self):
+        response = self.client.get(f'/job/{self.job.id}/status/')
+
+        self.assertEqual(response.status_code, 500)
+        self.assertIn('dictionary', response.json()['error'])
+
+    @override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT='')
+    def test_job_status_page_reports_mismatch(self):
+        response = self.client.get(f'/job/{self.job.id}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Transcript unavailable')
+
+    def test_check_status_reads_with_matching_dictionary(self):
+        with override_settings(TRANSCRIPT_COMPRESSION='zlib', TRANSCRIPT_COMPRESSION_DICT=self.dict_path):
+            response = self.client.get(f'/job/{self.job.id}/status/')
+
+        self.assertEqual(response.json()['transcript'], TEXT)
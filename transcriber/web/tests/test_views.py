@@ -0,0 +1,156 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from transcriber.web.models import ConversationAnalytics, TranscriptionJob
+from transcriber.web.services.transcription_service import TranscriptionResult
+from transcriber.web.views import handle_transcription
+
+
+def _analytics_for(job):
+    return ConversationAnalytics.objects.create(
+        job=job, duration_seconds=1, word_count=2, turn_count=1, speaker_count=1,
+        words_per_minute=120, overlap_seconds=0, speakers={},
+    )
+
+
+class HandleTranscriptionTests(TestCase):
+    @mock.patch('transcriber.web.views.TranscriptionService')
+    def test_analytics_failure_keeps_job_completed(self, service_class):
+        service_class.return_value.transcribe_file.return_value = TranscriptionResult(
+            transcript='Speaker 1: hello', speakers=1, duration=1.0,
+            created_at=datetime.now(), words=[(1, 'bad', 1.0)],
+        )
+        job = TranscriptionJob.objects.create(audio_file='audio/a.wav')
+
+        with self.assertLogs('transcriber.web.views', level='ERROR'):
+            handle_transcription(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.transcript_text, 'Speaker 1: hello')
+        self.assertIsNone(job.error_message)
+        self.assertFalse(ConversationAnalytics.objects.filter(job=job).exists())
+
+
+class ConversationAnalyticsViewTests(TestCase):
+    def setUp(self):
+        for day in (1, 1, 2, 3, 4):
+            job = TranscriptionJob.objects.create(
+                audio_file='audio/a.wav', created_at=datetime(2025, 1, day, tzinfo=timezone.utc),
+            )
+            _analytics_for(job)
+
+    def test_paginates_with_cursor(self):
+        job_ids, params = [], {'limit': 2}
+        while True:
+            data = self.client.get('/analytics/', params).json()
+            job_ids += [row['job_id'] for row in data['results']]
+            if not data['has_more']:
+                self.assertIsNone(data['next_cursor'])
+                break
+            params['cursor'] = data['next_cursor']
+
+        expected = list(TranscriptionJob.objects.order_by('created_at', 'id').values_list('id', flat=True))
+        self.assertEqual(job_ids, expected)
+
+    def test_negative_limit_is_clamped(self):
+        response = self.client.get('/analytics/', {'limit': -1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get('/analytics/', {'cursor': 'nope'})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class JobListViewTests(TestCase):
+    def setUp(self):
+        same_time = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        self.older = TranscriptionJob.objects.create(
+            audio_file='audio/old.wav', created_at=datetime(2025, 1, 1, tzinfo=timezone.utc), status='completed',
+        )
+        # Several jobs sharing created_at, so pages must break ties on id
+        self.tied = [
+            TranscriptionJob.objects.create(audio_file=f'audio/{i}.wav', created_at=same_time, status=status)
+            for i, status in enumerate(['pending', 'completed', 'failed', 'completed'])
+        ]
+        self.newer = TranscriptionJob.objects.create(
+            audio_file='audio/new.wav', created_at=datetime(2025, 1, 3, tzinfo=timezone.utc), status='pending',
+        )
+
+    def _all_pages(self, **params):
+        job_ids = []
+        while True:
+            data = self.client.get('/jobs/', params).json()
+            job_ids += [job['id'] for job in data['results']]
+            if data['next_cursor'] is None:
+                return job_ids
+            params['cursor'] = data['next_cursor']
+
+    def test_lists_newest_first(self):
+        data = self.client.get('/jobs/').json()
+
+        expected = [self.newer.id] + [job.id for job in reversed(self.tied)] + [self.older.id]
+        self.assertEqual([job['id'] for job in data['results']], expected)
+        self.assertIsNone(data['next_cursor'])
+        self.assertEqual(data['results'][0]['status_url'], f'/job/{self.newer.id}/status/')
+
+    def test_cursor_pages_through_equal_created_at(self):
+        expected = [self.newer.id] + [job.id for job in reversed(self.tied)] + [self.older.id]
+
+        for limit in (1, 2, 3):
+            with self.subTest(limit=limit):
+                self.assertEqual(self._all_pages(limit=limit), expected)
+
+    def test_status_filter(self):
+        completed = [job.id for job in reversed(self.tied) if job.status == 'completed'] + [self.older.id]
+
+        self.assertEqual(self._all_pages(status='completed', limit=1), completed)
+
+    def test_bad_limit_and_cursor_are_rejected(self):
+        self.assertEqual(self.client.get('/jobs/', {'limit': 'many'}).status_code, 400)
+        self.assertEqual(self.client.get('/jobs/', {'cursor': 'bm90IGEgY3Vyc29y'}).status_code, 400)
+        self.assertEqual(self.client.get('/jobs/', {'cursor': '%%%'}).status_code, 400)
+
+    def test_does_not_load_transcripts(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/jobs/')
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"transcript', queries[0]['sql'])
+
+
+class DeferredTranscriptTests(TestCase):
+    def setUp(self):
+        self.pending = TranscriptionJob.objects.create(audio_file='audio/a.wav', status='pending')
+        self.completed = TranscriptionJob.objects.create(
+            audio_file='audio/b.wav', status='completed', transcript='Speaker 1: hello',
+        )
+
+    def test_check_status_skips_transcript_until_completed(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(f'/job/{self.pending.id}/status/').json()
+
+        self.assertEqual(data, {'status': 'pending', 'transcript': None, 'error': None})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"transcript', queries[0]['sql'])
+
+    def test_check_status_loads_transcript_once_completed(self):
+        with self.assertNumQueries(2):
+            data = self.client.get(f'/job/{self.completed.id}/status/').json()
+
+        self.assertEqual(data['transcript'], 'Speaker 1: hello')
+
+    def test_index_defers_transcripts(self):
+        response = self.client.get('/')
+
+        recent_jobs = list(response.context['recent_jobs'])
+        self.assertEqual(len(recent_jobs), 2)
+        for job in recent_jobs:
+            self.assertTrue({'transcript', 'transcript_compressed', 'error_message'} <= job.get_deferred_fields())
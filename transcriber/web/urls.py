@@ -3,6 +3,10 @@ from . import views
 
 urlpatterns = [
     path('', views.index, name='index'),
+    path('jobs/', views.job_list, name='job_list'),
     path('job/<int:job_id>/', views.job_status, name='job_status'),
     path('job/<int:job_id>/status/', views.check_status, name='check_status'),
+    path('batch/', views.bulk_upload, name='bulk_upload'),
+    path('batch/<int:batch_id>/status/', views.batch_status, name='batch_status'),
+    path('analytics/', views.conversation_analytics, name='conversation_analytics'),
 ]
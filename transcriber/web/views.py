@@ -1,18 +1,38 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
 from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
-from .models import TranscriptionJob
-from .forms import TranscriptionForm
+from django.views.decorators.http import require_POST
+from .compression import TranscriptDecompressionError
+from .models import ConversationAnalytics, TranscriptionBatch, TranscriptionJob
+from .forms import BulkTranscriptionForm, TranscriptionForm
+from .services.analytics_service import compute_conversation_analytics
+from .services.archive_service import ExtractionBudget, iter_audio_members
 from .services.transcription_service import TranscriptionService
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+import binascii
+import logging
+import os
+import posixpath
 import threading
+import uuid
+
+logger = logging.getLogger(__name__)
 
 
 def handle_transcription(job_id):
     """Background task to handle transcription"""
-    job = TranscriptionJob.objects.get(id=job_id)
+    job = TranscriptionJob.objects.only('id', 'audio_file', 'status').get(id=job_id)
     try:
         job.status = 'processing'
-        job.save()
+        job.save(update_fields=['status'])
         
         # Initialize service and process file
         service = TranscriptionService()
@@ -21,16 +41,39 @@ def handle_transcription(job_id):
         if result.error:
             job.status = 'failed'
             job.error_message = result.error
+            job.save(update_fields=['status', 'error_message'])
         else:
             job.status = 'completed'
-            job.transcript = result.transcript
-            
-        job.save()
+            try:
+                job.transcript_text = result.transcript
+            except Exception:
+                # Never lose a paid-for transcript to a compression problem
+                logger.exception("Could not compress transcript for job %s; storing it uncompressed", job.id)
+                job.transcript, job.transcript_compressed = result.transcript, None
+            job.save(update_fields=['status', 'transcript', 'transcript_compressed'])
         
     except Exception as e:
         job.status = 'failed'
         job.error_message = str(e)
-        job.save()
+        job.save(update_fields=['status', 'error_message'])
+        return
+
+    if job.status == 'completed':
+        # Analytics are a by-product; a failure here must not fail the job
+        try:
+            analytics = compute_conversation_analytics(result.words)
+            if analytics:
+                ConversationAnalytics.objects.update_or_create(job=job, defaults=analytics)
+        except Exception:
+            logger.exception("Could not compute conversation analytics for job %s", job.id)
+
+
+# One pool shared by every batch, so BULK_MAX_WORKERS bounds concurrent
+# bulk transcriptions process-wide rather than per batch
+batch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('BULK_MAX_WORKERS', '4')),
+    thread_name_prefix='transcription-batch',
+)
 
 
 def index(request):
@@ -46,22 +89,232 @@ def index(request):
     else:
         form = TranscriptionForm()
     
-    recent_jobs = TranscriptionJob.objects.all()[:5]
+    recent_jobs = TranscriptionJob.objects.only('id', 'status', 'created_at')[:5]
     return render(request, 'web/index.html', {'form': form, 'recent_jobs': recent_jobs})
 
 
+def _build_job(name, fileobj, speaker_count, staging_dir):
+    """Store an audio file under staging_dir and return an unsaved job pointing at it"""
+    job = TranscriptionJob(speaker_count=speaker_count)
+    field = job.audio_file.field
+    target = posixpath.join(staging_dir, field.storage.get_valid_name(os.path.basename(name)))
+    # Copies straight from the upload/archive stream into media storage
+    job.audio_file = field.storage.save(target, File(fileobj, name=name), max_length=field.max_length)
+    return job
+
+
+def _discard_staging_dir(staging_dir):
+    """Delete everything a failed bulk upload wrote, including partial copies"""
+    storage = TranscriptionJob._meta.get_field('audio_file').storage
+    if not storage.exists(staging_dir):
+        return
+    _, files = storage.listdir(staging_dir)
+    for name in files:
+        storage.delete(posixpath.join(staging_dir, name))
+    storage.delete(staging_dir)
+
+
+@csrf_exempt
+@require_POST
+def bulk_upload(request):
+    """API endpoint to create a batch of jobs from multiple files and/or archives"""
+    form = BulkTranscriptionForm(request.POST, request.FILES)
+    if not form.is_valid():
+        return JsonResponse({'errors': form.errors}, status=400)
+
+    speaker_count = form.cleaned_data['speaker_count'] or 2
+    budget = ExtractionBudget(
+        max_files=int(os.getenv('BULK_MAX_FILES', '1000')),
+        max_bytes=int(os.getenv('BULK_MAX_BYTES', str(2 * 1024 ** 3))),
+    )
+    # Every file of this upload goes into its own directory, so a failed upload
+    # can remove exactly what it wrote without touching concurrent uploads
+    upload_to = TranscriptionJob._meta.get_field('audio_file').upload_to
+    staging_dir = posixpath.join(upload_to, f"batch-{uuid.uuid4().hex}")
+    jobs = []
+    try:
+        for uploaded in form.cleaned_data['audio_files']:
+            budget.add_file()
+            budget.add_bytes(uploaded.size)
+            jobs.append(_build_job(uploaded.name, uploaded, speaker_count, staging_dir))
+        for archive in form.cleaned_data['archives']:
+            for name, member in iter_audio_members(archive, budget):
+                jobs.append(_build_job(name, member, speaker_count, staging_dir))
+    except ValueError as e:
+        _discard_staging_dir(staging_dir)
+        return JsonResponse({'error': str(e)}, status=400)
+    except Exception:
+        _discard_staging_dir(staging_dir)
+        raise
+
+    if not jobs:
+        return JsonResponse({'error': 'No supported audio files found in upload'}, status=400)
+
+    with transaction.atomic():
+        batch = TranscriptionBatch.objects.create()
+        for job in jobs:
+            job.batch = batch
+        TranscriptionJob.objects.bulk_create(jobs)
+
+    job_ids = [job.id for job in jobs]
+    # Start transcription in background
+    for job_id in job_ids:
+        batch_executor.submit(handle_transcription, job_id)
+
+    return JsonResponse({
+        'batch_id': batch.id,
+        'job_ids': job_ids,
+        'status_url': reverse('batch_status', args=[batch.id]),
+        'progress': batch.progress(),
+    }, status=202)
+
+
+def batch_status(request, batch_id):
+    """API endpoint to check aggregate progress of a batch"""
+    batch = get_object_or_404(TranscriptionBatch, id=batch_id)
+    return JsonResponse({
+        'batch_id': batch.id,
+        'created_at': batch.created_at.isoformat(),
+        'progress': batch.progress(),
+        'jobs': list(batch.jobs.order_by('id').values('id', 'status')),
+    })
+
+
+def _parse_range_bound(value, end=False):
+    """Parse an ISO date or datetime query parameter into an aware datetime"""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date: {value}")
+        # A bare end date includes the whole day
+        parsed = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _encode_cursor(created_at, job_id):
+    raw = f"{created_at.isoformat()}|{job_id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor):
+    try:
+        created_at, job_id = urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+        parsed = parse_datetime(created_at)
+        if parsed is None:
+            raise ValueError
+        return parsed, int(job_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def conversation_analytics(request):
+    """API endpoint serving precomputed conversation analytics for many jobs.
+
+    Results are ordered oldest first and keyset-paginated on (job created_at,
+    job id); pass the returned next_cursor as ?cursor= to fetch the next page.
+    """
+    queryset = ConversationAnalytics.objects.order_by('job__created_at', 'job_id')
+    try:
+        if request.GET.get('start'):
+            queryset = queryset.filter(job__created_at__gte=_parse_range_bound(request.GET['start']))
+        if request.GET.get('end'):
+            queryset = queryset.filter(job__created_at__lt=_parse_range_bound(request.GET['end'], end=True))
+        if request.GET.get('cursor'):
+            created_at, job_id = _decode_cursor(request.GET['cursor'])
+            queryset = queryset.filter(
+                Q(job__created_at__gt=created_at) | Q(job__created_at=created_at, job_id__gt=job_id)
+            )
+        limit = max(1, min(int(request.GET.get('limit', '1000')), 10000))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    # Fetch one extra row to know whether another page exists
+    rows = list(queryset.values(
+        'job_id', 'job__created_at', 'duration_seconds', 'word_count', 'turn_count',
+        'speaker_count', 'words_per_minute', 'overlap_seconds', 'speakers',
+    )[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(rows[-1]['job__created_at'], rows[-1]['job_id'])
+    for row in rows:
+        row['created_at'] = row.pop('job__created_at').isoformat()
+    return JsonResponse({
+        'count': len(rows),
+        'has_more': has_more,
+        'next_cursor': next_cursor,
+        'results': rows,
+    })
+
+
+def job_list(request):
+    """API endpoint listing jobs newest first, keyset-paginated on (created_at, id)"""
+    queryset = TranscriptionJob.objects.only(
+        'id', 'audio_file', 'created_at', 'status', 'speaker_count', 'batch_id',
+    ).order_by('-created_at', '-id')
+    try:
+        limit = max(1, min(int(request.GET.get('limit', '50')), 500))
+        if request.GET.get('status'):
+            queryset = queryset.filter(status=request.GET['status'])
+        if request.GET.get('cursor'):
+            created_at, job_id = _decode_cursor(request.GET['cursor'])
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=job_id)
+            )
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    # Fetch one extra row to know whether another page exists
+    jobs = list(queryset[:limit + 1])
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    return JsonResponse({
+        'results': [{
+            'id': job.id,
+            'status': job.status,
+            'created_at': job.created_at.isoformat(),
+            'audio_file': job.audio_file.name,
+            'speaker_count': job.speaker_count,
+            'batch_id': job.batch_id,
+            'status_url': reverse('check_status', args=[job.id]),
+        } for job in jobs],
+        'next_cursor': _encode_cursor(jobs[-1].created_at, jobs[-1].id) if has_more else None,
+    })
+
+
 def job_status(request, job_id):
     """Display job status and results"""
     job = get_object_or_404(TranscriptionJob, id=job_id)
-    return render(request, 'web/job_status.html', {'job': job})
+    transcript, transcript_error = None, None
+    if job.status == 'completed':
+        try:
+            transcript = job.transcript_text
+        except TranscriptDecompressionError as e:
+            transcript_error = str(e)
+    return render(request, 'web/job_status.html', {
+        'job': job,
+        'transcript': transcript,
+        'transcript_error': transcript_error,
+    })
 
 
 @csrf_exempt
 def check_status(request, job_id):
     """API endpoint to check job status"""
-    job = get_object_or_404(TranscriptionJob, id=job_id)
+    # Polls hit this constantly; only load the transcript once it exists
+    job = get_object_or_404(TranscriptionJob.objects.only('id', 'status', 'error_message'), id=job_id)
+    if job.status == 'completed':
+        job.refresh_from_db(fields=['transcript', 'transcript_compressed'])
+        try:
+            transcript = job.transcript_text
+        except TranscriptDecompressionError as e:
+            return JsonResponse({'status': job.status, 'transcript': None, 'error': str(e)}, status=500)
     return JsonResponse({
         'status': job.status,
-        'transcript': job.transcript if job.status == 'completed' else None,
+        'transcript': transcript if job.status == 'completed' else None,
         'error': job.error_message if job.status == 'failed' else None
     })